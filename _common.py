@@ -0,0 +1,207 @@
+import math
+from functools import lru_cache
+from string import Template
+
+import numpy as np
+import streamlit as st
+
+# UK 2023/24 income tax bands: 0%, 20%, 40%, 45%
+TAX_BAND_EDGES = np.array([0, 12570, 50270, 125140, np.inf])
+TAX_BAND_WIDTHS = np.diff(TAX_BAND_EDGES)
+TAX_BAND_RATES = np.array([0.0, 0.20, 0.40, 0.45])
+
+# Share of each pot drawn down as income every year
+DRAWDOWN_RATE = 0.04
+
+# --- HTML Templates ---
+RESULT_TPL = Template("""
+<h2 style="color:white;">Estimated Retirement at Age $age</h2>
+<h1 style="color:green;">£$net per year</h1>
+<h3 style="color:white;">Monthly Net Income:</h3> <h2 style="color:green;">£$monthly</h2>
+""")
+POT_LINE_TPL = Template(
+    "<span style='color:white;'>$label:</span> <span style='color:green;'>£$value</span>"
+)
+INCOME_LINE_TPL = Template(
+    "<span style='color:white;'>$label (Gross):</span> <span style='color:green;'>£$gross</span> &raquo; <span style='color:green;'>Net: £$net</span>"
+)
+
+# --- Helper Functions ---
+def _growth_factors(monthly_rate, months):
+    # Growth of a lump sum and of a 1-per-month contribution stream
+    growth = math.pow(1.0 + monthly_rate, months)
+    if monthly_rate != 0:
+        annuity = (growth - 1) / monthly_rate
+    else:
+        annuity = float(months)
+    return growth, annuity
+
+@st.cache_resource(show_spinner=False)
+def get_fv_kernel():
+    # Compiled once per process and shared by every session; numba is
+    # imported here so it stays out of module import time
+    from numba import njit
+
+    kernel = njit(cache=True, fastmath=True)(_growth_factors)
+    kernel(0.005, 1)
+    return kernel
+
+@lru_cache(maxsize=64)
+def _monthly_rate(annual_rate):
+    return math.pow(1.0 + annual_rate, 1.0 / 12.0) - 1.0
+
+def growth_factors(annual_rate, months):
+    fv = get_fv_kernel()
+    return fv(_monthly_rate(annual_rate), months)
+
+def future_values(present_values, monthly_contributions, annual_rates, months):
+    if months <= 0:
+        return present_values
+    # Vectorised over pots: element i of each array describes one pot
+    monthly_rates = (1 + annual_rates) ** (1 / 12) - 1
+    growth = (1 + monthly_rates) ** months
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity = np.where(monthly_rates != 0, (growth - 1) / monthly_rates, months)
+    fv_series = np.where(monthly_contributions != 0, monthly_contributions * annuity, 0.0)
+    return present_values * growth + fv_series
+
+def years_between(d1, d2):
+    # Whole years from d1 to d2, less one if d2's month/day falls before d1's
+    return d2.year - d1.year - ((d2.month, d2.day) < (d1.month, d1.day))
+
+def compute_tax(total_gross_income):
+    # Amount of income falling inside each band, taxed at its marginal rate
+    taxed = np.clip(total_gross_income - TAX_BAND_EDGES[:-1], 0, TAX_BAND_WIDTHS)
+    return float(taxed @ TAX_BAND_RATES)
+
+@st.cache_data(show_spinner=False)
+def compute(
+    today,
+    dob,
+    years_to_retirement,
+    current_pension_pot,
+    monthly_pension_contribution,
+    pension_growth_rate,
+    current_isa_pot,
+    monthly_isa_contribution,
+    isa_growth_rate,
+    current_house_value,
+    future_house_price,
+    mortgage_outstanding,
+    db_income,
+    db_payout_age,
+    dividends_annual,
+):
+    # Returns a plain dict of primitives so cached results are safe to share
+    age_today = years_between(dob, today)
+    age_at_retirement = age_today + years_to_retirement
+    months_to_retirement = years_to_retirement * 12
+
+    # Pension and ISA pots at retirement; equal growth rates share one set
+    # of compounding factors
+    present_values = np.array([current_pension_pot, current_isa_pot], dtype=float)
+    monthly_contributions = np.array([monthly_pension_contribution, monthly_isa_contribution], dtype=float)
+    if pension_growth_rate == isa_growth_rate:
+        growth, annuity = growth_factors(pension_growth_rate, months_to_retirement)
+        pots = present_values * growth + monthly_contributions * annuity
+    else:
+        pots = future_values(
+            present_values=present_values,
+            monthly_contributions=monthly_contributions,
+            annual_rates=np.array([pension_growth_rate, isa_growth_rate]),
+            months=months_to_retirement
+        )
+    pension_pot_at_retirement, isa_pot_at_retirement = pots
+
+    # Equity released at retirement
+    equity_released = max(
+        current_house_value - future_house_price - mortgage_outstanding,
+        0
+    )
+
+    # Determine DB income if age >= payout age
+    db_income_effective = db_income if age_at_retirement >= db_payout_age else 0
+
+    # Gross incomes by source: drawdown on each pot, then DB and dividends
+    gross = np.concatenate([
+        np.append(pots, equity_released) * DRAWDOWN_RATE,
+        [db_income_effective, dividends_annual]
+    ])
+    gross_pension, gross_isa, gross_equity, gross_db, gross_dividends = gross
+
+    total_gross_income = gross.sum()
+
+    # Tax Calculation (UK bands)
+    tax = compute_tax(total_gross_income)
+
+    net_income = total_gross_income - tax
+    monthly_net_income = net_income / 12
+
+    # Allocate tax proportionally to each source for net breakdown
+    proportions = gross / total_gross_income if total_gross_income > 0 else 0
+    net_pension, net_isa, net_equity, net_db, net_dividends = gross - tax * proportions
+
+    return {
+        "age_at_retirement": int(age_at_retirement),
+        "net_income": float(net_income),
+        "monthly_net_income": float(monthly_net_income),
+        "pension_pot_at_retirement": float(pension_pot_at_retirement),
+        "isa_pot_at_retirement": float(isa_pot_at_retirement),
+        "equity_released": float(equity_released),
+        "db_income_effective": float(db_income_effective),
+        "gross_pension": float(gross_pension),
+        "net_pension": float(net_pension),
+        "gross_isa": float(gross_isa),
+        "net_isa": float(net_isa),
+        "gross_equity": float(gross_equity),
+        "net_equity": float(net_equity),
+        "gross_db": float(gross_db),
+        "net_db": float(net_db),
+        "gross_dividends": float(gross_dividends),
+        "net_dividends": float(net_dividends),
+    }
+
+# --- Display Results ---
+def render_results(result):
+    st.markdown(RESULT_TPL.substitute(
+        age=result["age_at_retirement"],
+        net=f"{result['net_income']:,.0f}",
+        monthly=f"{result['monthly_net_income']:,.0f}"
+    ), unsafe_allow_html=True)
+
+    st.markdown("---")
+    st.markdown("## 🔍 Retirement Pot Details")
+    pot_details_html = "<br>".join(
+        POT_LINE_TPL.substitute(label=label, value=f"{result[key]:,.0f}")
+        for label, key in [
+            ("Pension Pot at Retirement", "pension_pot_at_retirement"),
+            ("ISA Pot at Retirement", "isa_pot_at_retirement"),
+            ("Equity Released", "equity_released"),
+            ("DB Income at Retirement", "db_income_effective"),
+        ]
+    )
+    st.markdown(pot_details_html, unsafe_allow_html=True)
+
+    st.markdown("---")
+    st.markdown("## 💡 Income Breakdown")
+    income_breakdown_html = "<br>".join(
+        INCOME_LINE_TPL.substitute(
+            label=label,
+            gross=f"{result['gross_' + key]:,.0f}",
+            net=f"{result['net_' + key]:,.0f}"
+        )
+        for label, key in [
+            ("Pension Drawdown", "pension"),
+            ("ISA Drawdown", "isa"),
+            ("Equity Drawdown", "equity"),
+            ("DB Pension", "db"),
+            ("Dividends", "dividends"),
+        ]
+    )
+    st.markdown(income_breakdown_html, unsafe_allow_html=True)
+
+    st.markdown("---")
+    st.markdown("## 📋 Assumptions")
+    st.markdown("- All investment growths assumed at 7% annually.\n- Tax calculated on total gross income using UK 2023/24 bands: 0% for £0–£12,570; 20% for £12,571–£50,270; 40% for £50,271–£125,140; 45% above £125,140.")
+
+    st.caption("This tool assumes fixed growth rates and simplified tax rules. For personalized advice, consult a financial adviser.")